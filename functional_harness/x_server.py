@@ -9,15 +9,43 @@ __license__ = "MIT"
 # pylint: disable=unsubscriptable-object,invalid-sequence-index
 # pylint: disable=wrong-import-order
 
-import logging, os, random, shutil, subprocess, tempfile  # nosec
+import logging, os, secrets, shutil, socket, struct, subprocess  # nosec
+import tempfile
 from contextlib import contextmanager
 from distutils.spawn import find_executable
+from functools import lru_cache
 
 # -- Type-Annotation Imports --
 from typing import Dict, Generator, List, Tuple
 
 log = logging.getLogger(__name__)
 
+#: :func:`find_executable`, memoized so repeated :func:`x_server` calls don't
+#: re-walk ``$PATH`` for the same commands
+_find_executable = lru_cache(maxsize=None)(find_executable)
+
+#: The ``FamilyLocal`` address family from :file:`X11/Xauth.h`
+_FAMILY_LOCAL = 256
+
+
+def _write_xauth(path: str, display_num: str, cookie: str):
+    """Write an :file:`.Xauthority` file granting access to a local display
+
+    This produces the same record as ``xauth add :N . COOKIE`` without
+    having to spawn :command:`xauth`.
+
+    :param path: The file to (over)write.
+    :param display_num: The display number, without the leading colon.
+    :param cookie: The ``MIT-MAGIC-COOKIE-1`` value as a hex string.
+    """
+    fields = (socket.gethostname().encode('utf8'),
+              display_num.encode('ascii'),
+              b'MIT-MAGIC-COOKIE-1',
+              bytes.fromhex(cookie))
+    with open(path, 'wb') as fobj:
+        fobj.write(struct.pack('>H', _FAMILY_LOCAL) + b''.join(
+            struct.pack('>H', len(field)) + field for field in fields))
+
 
 def _init_x_server(argv: List[str], verbose: bool = False
                    ) -> Tuple[subprocess.Popen, bytes]:
@@ -45,7 +73,16 @@ def _init_x_server(argv: List[str], verbose: bool = False
         xproc = subprocess.Popen(argv, pass_fds=[write_pipe],  # nosec
             env=env, stderr=subprocess.STDOUT, stdout=subprocess.DEVNULL)
 
-    display = os.read(read_pipe, 128).strip()
+    # Close our copy of the write end so that, if the X server dies before
+    # reporting a display number, the read sees EOF rather than blocking
+    os.close(write_pipe)
+    try:
+        display = os.read(read_pipe, 128).strip()
+    finally:
+        os.close(read_pipe)
+
+    if not display:
+        raise subprocess.CalledProcessError(xproc.wait(), argv)
     return xproc, display
 
 
@@ -59,10 +96,8 @@ def x_server(argv: List[str], screens: Dict[int, str]
     :param screens: A :any:`dict <dict>` mapping screen numbers to
         ``WxHxDEPTH`` strings. (eg. ``{0: '1024x768x32'}``)
 
-    :raises subprocess.CalledProcessError: The X server or :command:`xauth`
-        failed unexpectedly.
-    :raises FileNotFoundError: Could not find either the :command:`xauth`
-        command or ``argv[0]``.
+    :raises subprocess.CalledProcessError: The X server failed unexpectedly.
+    :raises FileNotFoundError: Could not find ``argv[0]``.
     :raises PermissionError: Somehow, we lack write permission inside a
         directory created by :func:`tempfile.mkdtemp`.
     :raises ValueError: ``argv[0]`` was not an X server binary we know how to
@@ -77,47 +112,40 @@ def x_server(argv: List[str], screens: Dict[int, str]
         servers rather than erroring out.
     """
     # Check for missing requirements
-    for cmd in ['xauth', argv[0]]:
-        if not find_executable(cmd):
-            # pylint: disable=undefined-variable
-            raise FileNotFoundError(  # NOQA
-                "Cannot find required command {!r}".format(cmd))
+    if not _find_executable(argv[0]):
+        # pylint: disable=undefined-variable
+        raise FileNotFoundError(  # NOQA
+            "Cannot find required command {!r}".format(argv[0]))
 
     x_server = None
     tempdir = tempfile.mkdtemp()
     try:
-        # Because random.getrandbits gets interpreted as a variable length,
-        # *ensure* we've got the right number of hex digits
-        magic_cookie = b''
-        while len(magic_cookie) < 32:
-            magic_cookie += hex(random.getrandbits(128))[2:34].encode('ascii')
-            magic_cookie = magic_cookie[:32]
-        assert len(magic_cookie) == 32, len(magic_cookie)  # nosec
+        # token_hex() always returns exactly 32 hex digits for 16 bytes and
+        # draws from the OS CSPRNG rather than the Mersenne Twister
+        magic_cookie = secrets.token_hex(16)
         xauthfile = os.path.join(tempdir, 'Xauthority')
         env = {'XAUTHORITY': xauthfile}
 
-        open(xauthfile, 'w').close()  # create empty file
-
         # Convert `screens` into the format Xorg servers expect
+        # (Identify the server once rather than once per screen)
         screen_argv = []
-        for screen_num, screen_geom in screens.items():
-            if 'Xvfb' in argv[0]:
+        if 'Xvfb' in argv[0]:
+            for screen_num, screen_geom in screens.items():
                 screen_argv.extend(['-screen', '%d' % screen_num, screen_geom])
-            elif 'Xephyr' in argv[0]:
+        elif 'Xephyr' in argv[0]:
+            for screen_geom in screens.values():
                 screen_argv.extend(['-screen', screen_geom])
-            else:
-                raise ValueError("Unrecognized X server. Cannot infer format "
-                                 "for specifying screen geometry.")
+        else:
+            raise ValueError("Unrecognized X server. Cannot infer format "
+                             "for specifying screen geometry.")
 
         # Initialize an X server on a free display number
         x_server, display_num = _init_x_server(argv + screen_argv)
 
         # Set up the environment and authorization
-        env['DISPLAY'] = ':%s' % display_num.decode('utf8')
-        subprocess.check_call(  # nosec
-            ['xauth', 'add', env['DISPLAY'], '.', magic_cookie],
-            env=env)
-        # FIXME: This xauth call once had a random failure. Retry.
+        display_num_str = display_num.decode('utf8')
+        env['DISPLAY'] = ':%s' % display_num_str
+        _write_xauth(xauthfile, display_num_str, magic_cookie)
 
         yield env
 
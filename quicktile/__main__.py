@@ -87,6 +87,9 @@ class QuickTileApp:
             were available.
         """
 
+        # Keep the geometry cache current without rescanning every window
+        self.winman.watch_geometry()
+
         # Attempt to set up the global hotkey support
         try:
             from . import keybinder  # pylint: disable=C0415
@@ -166,6 +169,9 @@ def argparser() -> ArgumentParser:
     parser.add_argument('--no-excepthook', action="store_true",
         default=False, help="Disable the error-handling dialog to allow for "
         "use in unattended scripting.")
+    parser.add_argument('--report-results', action="store_true",
+        default=False, help="Print an OK or FAIL line to stdout for each "
+        "command and keep going after failures. (For use by test harnesses)")
     parser.add_argument('--no-workarea', action="store_true",
         default=False, help="No effect. Retained for compatibility.")
     parser.add_argument('command', action="store", nargs="*",
@@ -235,7 +241,8 @@ def main() -> None:
         raise XInitError("Gtk failed to connect to the X server. Exiting.")
 
     try:
-        winman = WindowManager(x_display=x_display)
+        winman = WindowManager(x_display=x_display,
+            reposition_delay=config.getint('general', 'RepositionDelay'))
     except XInitError as err:
         logging.critical("%s", err)
         sys.exit(1)
@@ -262,10 +269,31 @@ def main() -> None:
         if args:
             winman.screen.force_update()
 
+            failed = False
             for arg in args.command:
-                commands.commands.call(arg, winman)
-            while Gtk.events_pending():
-                Gtk.main_iteration()
+                if args.report_results:
+                    try:
+                        # False means the command name wasn't recognized
+                        succeeded = commands.commands.call(arg, winman)
+                    except Exception:  # pylint: disable=broad-except
+                        logging.exception("Command %r failed", arg)
+                        succeeded = False
+
+                    print("%s %s" % ("OK" if succeeded else "FAIL", arg),
+                          flush=True)
+                    failed |= not succeeded
+                else:
+                    commands.commands.call(arg, winman)
+
+                # Let Wnck process the events queued so far before the next
+                # command runs. (This doesn't wait for the WM to finish
+                # applying any requested geometry, so later commands may still
+                # see the state from before earlier ones.)
+                while Gtk.events_pending():
+                    Gtk.main_iteration()
+
+            if failed:
+                sys.exit(1)
         elif not args.show_actions and not args.show_bindings:
             print(commands.commands)
             print("\nUse --help for a list of valid options.")
@@ -69,18 +69,16 @@ class CommandRegistry:
 
         .. todo:: Is the MPlayer safety hack in :meth:`get_window_meta` still
             necessary with the refactored window-handling code?
-        .. todo:: Can the :func:`logging.debug` call in :meth:`get_window_meta`
-            be reworked to call :meth:`Wnck.Window.get_name` lazily?
         """
         # Bail out early on None or things like the desktop window
         if not winman.is_relevant(window):
             return False
 
-        win_rect = Rectangle(*window.get_geometry())
-        logging.debug("Operating on window %r with title \"%s\" "
-                      "and geometry %r", window, window.get_name(), win_rect)
-
-        monitor_id, monitor_geom = winman.get_monitor(window)
+        # Don't pay for querying the title and geometry unless they'll be shown
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Operating on window %r with title \"%s\" "
+                          "and geometry %r", window, window.get_name(),
+                          Rectangle._make(window.get_geometry()))
 
         # MPlayer safety hack
         if not winman.usable_region:
@@ -89,6 +87,8 @@ class CommandRegistry:
                           "nothing.", winman.usable_region)
             return False
 
+        monitor_id, monitor_geom = winman.get_monitor(window)
+
         state.update({
             "monitor_id": monitor_id,
             "monitor_geom": monitor_geom,
@@ -210,8 +210,8 @@ class CommandRegistry:
             logging.debug("Executing command '%s' with arguments %r, %r",
                           command, args, kwargs)
 
-            # Workaround for #107 until I'm ready to solve it properly
-            winman.update_geometry_cache()
+            # Workaround for #107 when not watching for geometry changes
+            winman.ensure_geometry_cache()
 
             cmd(winman, *args, **kwargs)
 
@@ -247,7 +247,8 @@ def cycle_dimensions(winman: WindowManager,
         :func:`cycle_dimensions` with a custom type.
     """
     monitor_rect = state['monitor_geom']
-    win_rect_rel = Rectangle(*win.get_geometry()).to_relative(monitor_rect)
+    win_rect_rel = Rectangle._make(win.get_geometry()).to_relative(
+        monitor_rect)
 
     logging.debug("Selected preset sequence:\n\t%r", dimensions)
 
@@ -307,8 +308,7 @@ def cycle_monitors(winman: WindowManager,  # pylint: disable=too-many-arguments
                    win: Wnck.Window,
                    state: Dict[str, Any],
                    step: int = 1,
-                   force_wrap: bool = False,
-                   n_monitors: Optional[int] = None
+                   force_wrap: bool = False
                    ) -> None:
     """Cycle the active window between monitors.
 
@@ -321,16 +321,12 @@ def cycle_monitors(winman: WindowManager,  # pylint: disable=too-many-arguments
         :ref:`MovementsWrap <MovementsWrap>` to :any:`False`.
     """
     old_mon_id, _ = winman.get_monitor(win)
-    n_monitors = n_monitors or winman.gdk_screen.get_n_monitors()
+    monitor_geoms = winman.get_monitor_geometries()
     do_wrapping = (state['config'].getboolean('general', 'MovementsWrap') or
                    force_wrap)
 
-    new_mon_id = clamp_idx(old_mon_id + step, n_monitors, do_wrapping)
-    new_mon_geom = Rectangle.from_gdk(
-        winman.gdk_screen.get_monitor_geometry(new_mon_id))
-
-    # TODO: Unit test this
-    new_mon_geom *= winman.gdk_screen.get_monitor_scale_factor(new_mon_id)
+    new_mon_id = clamp_idx(old_mon_id + step, len(monitor_geoms), do_wrapping)
+    new_mon_geom = monitor_geoms[new_mon_id]
     logging.debug("Moving window to monitor %s, which has geometry %s",
                   new_mon_id, new_mon_geom)
 
@@ -361,7 +357,6 @@ def cycle_monitors_all(
     # Have to specify types in the description pending a fix for
     # https://github.com/agronholm/sphinx-autodoc-typehints/issues/124
 
-    n_monitors = winman.gdk_screen.get_n_monitors()
     curr_workspace = win.get_workspace()
 
     if not curr_workspace:
@@ -369,7 +364,7 @@ def cycle_monitors_all(
         return
 
     for window in winman.get_relevant_windows(curr_workspace):
-        cycle_monitors(winman, window, state, step, force_wrap, n_monitors)
+        cycle_monitors(winman, window, state, step, force_wrap)
 
 
 @commands.add_many({'move-to-{}'.format(name): [variant]
@@ -385,13 +380,14 @@ def move_to_position(winman: WindowManager,
     :param win: The window to operate on.
     """
     monitor_rect = state['monitor_geom']
-    win_rect = Rectangle(*win.get_geometry())
+    win_rect = Rectangle._make(win.get_geometry())
 
     # Build a target rectangle
     # TODO: Think about ways to refactor scaling for better maintainability
+    grav_x, grav_y = gravity.value
     target = Rectangle(
-        x=gravity.value[0] * monitor_rect.width,
-        y=gravity.value[1] * monitor_rect.height,
+        x=grav_x * monitor_rect.width,
+        y=grav_y * monitor_rect.height,
         width=win_rect.width,
         height=win_rect.height
     ).from_gravity(gravity).from_relative(monitor_rect)
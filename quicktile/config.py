@@ -24,6 +24,7 @@ DEFAULTS: Dict[str, CfgDict] = {
         'ColumnCount': 3,
         'MarginX_Percent': 0,
         'MarginY_Percent': 0,
+        'RepositionDelay': 0,
     },
     'keys': {
         "KP_Enter": "monitor-switch",
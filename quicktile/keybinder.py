@@ -13,7 +13,7 @@ from functools import reduce  # pylint: disable=redefined-builtin
 import gi
 gi.require_version('Gtk', '3.0')
 
-from gi.repository import GLib, Gtk, Gdk
+from gi.repository import Gtk, Gdk
 from Xlib import X
 from Xlib.display import Display
 from Xlib.error import BadAccess, DisplayConnectionError
@@ -40,6 +40,10 @@ class KeyBinder(object):
     :param x_display: An Xlib display handle. If :any:`None`, a new connection
         will be opened.
 
+    Events are not read from the connection by this class.
+    :meth:`handle_keypress` must be registered with something which does so,
+    such as :meth:`quicktile.wm.WindowManager.add_xevent_handler`.
+
     :raises XInitError: Failed to open a new X connection.
 
     .. _XGrabKey: https://tronche.com/gui/x/xlib/input/XGrabKey.html
@@ -74,17 +78,14 @@ class KeyBinder(object):
         self._ignored_modifiers: List[int] = [getattr(X, name) for name in
                                    self.ignored_modifiers]
 
-        # We want to receive KeyPress events
-        self.xroot.change_attributes(event_mask=X.KeyPressMask)
+        # We want to receive KeyPress events (without clobbering the
+        # PropertyChangeMask WindowManager may have set on the same connection)
+        self.xroot.change_attributes(event_mask=X.KeyPressMask |
+            self.xroot.get_attributes().your_event_mask)
 
         # Set up a handler to catch XGrabKey() failures
         self.xdisp.set_error_handler(self.cb_xerror)
 
-        # Merge python-xlib into the GLib event loop
-        # Source: http://www.pygtk.org/pygtk2tutorial/sec-MonitoringIO.html
-        GLib.io_add_watch(self.xroot.display, GLib.PRIORITY_DEFAULT,
-                         GLib.IO_IN, self.cb_xevent)
-
     def bind(self, accel: str, callback: Callable[[], None]) -> bool:
         """Bind a global key combination to a callback.
 
@@ -137,38 +138,6 @@ class KeyBinder(object):
         else:
             self.xdisp.display.default_error_handler(err)
 
-    def cb_xevent(self, src: GLib.IOChannel, cond: GLib.IOCondition,
-            handle: Optional[Display] = None) -> bool:
-        """:func:`GLib.io_add_watch` callback to dispatch X events to more
-        specific handlers.
-
-        :param src: Not used. Just needed to satisfy ``GIOFunc`` signature.
-        :param cond: Not used. Just to needed to satisfy ``GIOFunc`` signature.
-        :param handle: A handle to the Xlib display object with pending events.
-            A cached reference will be used if it is :any:`None`.
-        :rtype: :any:`True`
-        :returns: Always returns :any:`True` to prevent GLib from unsetting
-            the watch.
-
-        .. todo:: Make sure uncaught exceptions in :meth:`cb_xevent` are
-            prevented from making QuickTile unresponsive in the general case.
-        .. todo:: Switch to using :data:`python:typing.Literal` in the return
-            signature once it's no longer necessary to support Python
-            versions prior to 3.8.
-        .. todo:: Move :meth:`cb_xevent` out of keybinder into the core since
-            Xlib is no longer optional and dispatch should be shared with
-            :mod:`quicktile.wm` for responding to panel reservation changes.
-        """
-        handle = handle or self.xroot.display
-
-        for _ in range(0, handle.pending_events()):
-            xevent = handle.next_event()
-            if xevent.type == X.KeyPress:
-                self.handle_keypress(xevent)
-
-        # Necessary for proper function
-        return True
-
     def handle_keypress(self, xevent: XKeyPress):
         """Resolve :class:`Xlib.protocol.event.KeyPress` events to the
         :class:`quicktile.commands.CommandRegistry` commands associated with
@@ -178,8 +147,6 @@ class KeyBinder(object):
         .. todo:: Use a proper ``index`` argument for
             :meth:`Xlib.display.Display.keycode_to_keysym` in
             :meth:`handle_keypress`'s debug messaging.
-        .. todo:: Only call the code to look up a human-readable name for a
-            key event if the log level is high enough that it won't be wasted.
         """
         keysig = (xevent.detail, xevent.state)
         if keysig not in self._keys:
@@ -188,10 +155,11 @@ class KeyBinder(object):
             return
 
         # Display a meaningful debug message
-        ksym = self.xdisp.keycode_to_keysym(keysig[0], 0)
-        gmod = Gdk.ModifierType(keysig[1])
-        kbstr = Gtk.accelerator_name(ksym, gmod)
-        logging.debug("Received keybind: %s", kbstr)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            ksym = self.xdisp.keycode_to_keysym(keysig[0], 0)
+            gmod = Gdk.ModifierType(keysig[1])
+            kbstr = Gtk.accelerator_name(ksym, gmod)
+            logging.debug("Received keybind: %s", kbstr)
 
         # Call the associated callback
         self._keys[keysig]()
@@ -314,6 +282,8 @@ def init(modmask: Optional[str],
         logging.error("%s", err)
         return None
     else:
+        winman.add_xevent_handler(X.KeyPress, keybinder.handle_keypress)
+
         # TODO: Take a mapping dict with pre-modmasked keys
         #       and pre-closured commands
         for key, func in mappings.items():
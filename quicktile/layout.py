@@ -13,7 +13,7 @@ import logging
 from .util import Gravity, Rectangle
 
 # -- Type-Annotation Imports --
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 from .util import GeomTuple, PercentRectTuple
 
 #: MyPy type alias for either `Rectangle` or `GeomTuple`
@@ -109,6 +109,11 @@ class GravityLayout(object):  # pylint: disable=too-few-public-methods
         (x.lower().replace('_', '-'), getattr(Gravity, x)) for
         x in Gravity.__members__)
 
+    #: :any:`GRAVITIES` with the values pre-resolved to ``(x, y)`` tuples so
+    #: :meth:`__call__` only needs a single dict lookup.
+    _GRAVITY_VALUES: Dict[str, Tuple[float, float]] = {
+        name: grav.value for name, grav in GRAVITIES.items()}
+
     def __init__(self, margin_x: float = 0, margin_y: float = 0):
         if margin_x >= 1:
             log.warning("margin_x should be a percentage of the screen width "
@@ -159,10 +164,11 @@ class GravityLayout(object):  # pylint: disable=too-few-public-methods
             :class:`quicktile.util.Rectangle`.
         """
 
-        x = x or self.GRAVITIES[gravity].value[0]
-        y = y or self.GRAVITIES[gravity].value[1]
-        offset_x = width * self.GRAVITIES[gravity].value[0]
-        offset_y = height * self.GRAVITIES[gravity].value[1]
+        grav_x, grav_y = self._GRAVITY_VALUES[gravity]
+        x = x or grav_x
+        y = y or grav_y
+        offset_x = width * grav_x
+        offset_y = height * grav_y
 
         return (round(x - offset_x + self.margin_x, 10),
                 round(y - offset_y + self.margin_y, 10),
@@ -281,6 +281,27 @@ class StrutPartial(_StrutPartial):
             left_start_y, left_end_y, right_start_y, right_end_y,
             top_start_x, top_end_x, bottom_start_x, bottom_end_x)
 
+    @classmethod
+    def from_property(cls, value: Sequence[int]) -> 'StrutPartial':
+        """Construct a :class:`StrutPartial` from the raw value of a
+        `_NET_WM_STRUT_PARTIAL`_ or `_NET_WM_STRUT`_ property.
+
+        Complete `_NET_WM_STRUT_PARTIAL`_ values are passed straight to the
+        underlying tuple constructor, since they don't need defaults filled in.
+
+        .. doctest::
+
+            >>> StrutPartial.from_property(range(12)) == StrutPartial(
+            ...     *range(12))
+            True
+            >>> StrutPartial.from_property([1, 2, 3, 4]) == StrutPartial(
+            ...     1, 2, 3, 4)
+            True
+        """
+        if len(value) == len(cls._fields):
+            return cls._make(value)
+        return cls(*value)
+
     def as_rects(self, desktop_rect: 'Rectangle'
                  ) -> 'List[Tuple[Edge, Rectangle]]':
         """Resolve self into absolute coordinates relative to ``desktop_rect``
@@ -294,32 +315,37 @@ class StrutPartial(_StrutPartial):
         be :code:`22 + (1080 - 1024) = 56px` to account for the dead space
         below the 1024px-tall monitors.)
         """
-        return [x for x in (
-            # Left
-            (Edge.LEFT, Rectangle(
+        (left, right, top, bottom, left_start_y, left_end_y, right_start_y,
+         right_end_y, top_start_x, top_end_x, bottom_start_x,
+         bottom_end_x) = self
+        # Most struts only reserve one edge, so skip building and clipping
+        # the zero-thickness rectangles for the other three entirely
+        rects = []
+        if left:
+            rects.append((Edge.LEFT, Rectangle(
                 x=desktop_rect.x,
-                y=self.left_start_y,
-                width=self.left,
-                y2=self.left_end_y).intersect(desktop_rect)),
-            # Right
-            (Edge.RIGHT, Rectangle(
+                y=left_start_y,
+                width=left,
+                y2=left_end_y).intersect(desktop_rect)))
+        if right:
+            rects.append((Edge.RIGHT, Rectangle(
                 x=desktop_rect.x2,
-                y=self.right_start_y,
-                width=-self.right,
-                y2=self.right_end_y).intersect(desktop_rect)),
-            # Top
-            (Edge.TOP, Rectangle(
-                x=self.top_start_x,
+                y=right_start_y,
+                width=-right,
+                y2=right_end_y).intersect(desktop_rect)))
+        if top:
+            rects.append((Edge.TOP, Rectangle(
+                x=top_start_x,
                 y=desktop_rect.y,
-                x2=self.top_end_x,
-                height=self.top).intersect(desktop_rect)),
-            # Bottom
-            (Edge.BOTTOM, Rectangle(
-                x=self.bottom_start_x,
+                x2=top_end_x,
+                height=top).intersect(desktop_rect)))
+        if bottom:
+            rects.append((Edge.BOTTOM, Rectangle(
+                x=bottom_start_x,
                 y=desktop_rect.y2,
-                x2=self.bottom_end_x,
-                height=-self.bottom).intersect(desktop_rect)),
-        ) if bool(x[1])]
+                x2=bottom_end_x,
+                height=-bottom).intersect(desktop_rect)))
+        return [x for x in rects if x[1]]
 
 
 # Keep _StrutPartial from showing up in automated documentation
@@ -432,11 +458,9 @@ class Rectangle(_Rectangle):
             >>> Rectangle(320, 240, 640, 480) * 0.5
             Rectangle(x=160, y=120, width=320, height=240)
         """
-        return self._replace(
-            x=int(self.x * factor),
-            y=int(self.y * factor),
-            width=int(self.width * factor),
-            height=int(self.height * factor))
+        x, y, width, height = self  # pylint: disable=invalid-name
+        return Rectangle._make((int(x * factor), int(y * factor),
+                           int(width * factor), int(height * factor)))
 
     @property
     def xy(self) -> Tuple[int, int]:  # pylint: disable=invalid-name
@@ -481,13 +505,20 @@ class Rectangle(_Rectangle):
         .. todo:: Refactor the tests so they don't only test :meth:`closest_of`
            indirectly and don't engage in needless duplication.
         """
+        # Equivalent to to_gravity(Gravity.CENTER).to_point().xy, but with the
+        # gravity resolved once and no intermediate Rectangles per candidate
+        grav_x, grav_y = Gravity.CENTER.value
+        p_self = (int(self.x + (self.width * grav_x)),
+                  int(self.y + (self.height * grav_y)))
+
         choices = []
         for candidate in candidates:
             overlap = candidate.intersect(self)
 
-            p_self = self.to_gravity(Gravity.CENTER).to_point()
-            p_candidate = candidate.to_gravity(Gravity.CENTER).to_point()
-            euc_dist = euclidean_dist(p_self.xy, p_candidate.xy)
+            x, y, width, height = candidate  # pylint: disable=invalid-name
+            p_candidate = (int(x + (width * grav_x)),
+                           int(y + (height * grav_y)))
+            euc_dist = euclidean_dist(p_self, p_candidate)
 
             choices.append((overlap.area, -euc_dist, candidate))
 
@@ -522,29 +553,27 @@ class Rectangle(_Rectangle):
         """
         if not isinstance(other, Rectangle):
             raise TypeError("Expected 'Rectangle', got %r", type(other))
-        new = self
+        # pylint: disable=invalid-name
+        x, y, width, height = self
+        o_x, o_y, o_x2, o_y2 = other.x, other.y, other.x2, other.y2
 
         # Slide left or right (prefer aligning left edges if too wide)
-        if new.x < other.x:
-            new = new._replace(x=other.x)
-        elif new.x2 > other.x2:
-            # TODO: Rework Rectangle so x can be omitted as long as width
-            #       and x2 are supplied.
-            new = Rectangle(
-                x=max(other.x2 - new.width, 0), y=new.y,
-                width=new.width, height=new.height)
+        if x < o_x:
+            x = o_x
+        elif x + width > o_x2:
+            x = max(o_x2 - width, 0)
 
         # Slide up or down (prefer aligning tops if too tall)
-        if new.y < other.y:
-            new = new._replace(y=other.y)
-        elif new.y2 > other.y2:
-            # TODO: Rework Rectangle so y can be omitted as long as height
-            #       and y2 are supplied.
-            new = Rectangle(
-                x=new.x, y=max(other.y2 - new.height, 0),
-                width=new.width, height=new.height)
-
-        return new
+        if y < o_y:
+            y = o_y
+        elif y + height > o_y2:
+            y = max(o_y2 - height, 0)
+
+        # Return self if it already fit and skip __new__'s validation if not,
+        # since width and height are unchanged
+        if x == self.x and y == self.y:
+            return self
+        return Rectangle._make((x, y, width, height))
 
     def moved_off_of(self, other: 'Rectangle') -> 'Rectangle':
         """Return a copy of ``self`` that has been moved as little as possible
@@ -573,7 +602,7 @@ class Rectangle(_Rectangle):
             :meth:`moved_off_of`.
         """
         # If there's no overlap, just trust in a tuple's immutability
-        if not self.intersect(other):
+        if not self.overlaps(other):
             return self
 
         return self.closest_of([
@@ -587,6 +616,22 @@ class Rectangle(_Rectangle):
                 x=self.x, width=self.width, height=self.height, y=other.y2),
         ])
 
+    def overlaps(self, other: 'Rectangle') -> bool:
+        """Equivalent to ``bool(self.intersect(other))`` but without
+        constructing the intersection, assuming top-left gravity.
+
+        .. doctest::
+
+            >>> Rectangle(0, 0, 40, 40).overlaps(Rectangle(20, 20, 50, 60))
+            True
+            >>> Rectangle(0, 0, 40, 40).overlaps(Rectangle(40, 0, 10, 10))
+            False
+            >>> Rectangle(0, 0, 40, 40).overlaps(Rectangle(20, 20, 0, 0))
+            False
+        """
+        return bool(max(self.x, other.x) < min(self.x2, other.x2) and
+                    max(self.y, other.y) < min(self.y2, other.y2))
+
     def intersect(self, other: 'Rectangle') -> 'Rectangle':
         """The intersection of two rectangles, assuming top-left gravity.
 
@@ -609,7 +654,8 @@ class Rectangle(_Rectangle):
         x1, y1 = max(self.x, other.x), max(self.y, other.y)
         x2, y2 = min(self.x2, other.x2), min(self.y2, other.y2)
 
-        return Rectangle(x1, y1, max(0, x2 - x1), max(0, y2 - y1))
+        # The result is already normalized, so skip __new__'s validation
+        return Rectangle._make((x1, y1, max(0, x2 - x1), max(0, y2 - y1)))
 
     def subtract(self, other: 'Rectangle') -> 'Rectangle':
         """Return a copy of ``self`` which has been shrunk along one axis
@@ -641,6 +687,10 @@ class Rectangle(_Rectangle):
             ``constrain_within`` or ``preferred_direction`` argument to
             :meth:`subtract`.
         """
+        # Skip the candidate generation in moved_off_of if we can
+        if not self.overlaps(other):
+            return self
+
         result = self.intersect(self.moved_off_of(other))
 
         return result if result != self else self
@@ -655,8 +705,7 @@ class Rectangle(_Rectangle):
         If ``other`` is not a :class:`Rectangle`, this will always return
         :any:`False`.
 
-        If you need to check for overlap, check whether
-        :meth:`intersect` is truthy.
+        If you need to check for overlap, use :meth:`overlaps`.
 
         This assumes top-left gravity.
         """
@@ -686,7 +735,8 @@ class Rectangle(_Rectangle):
         x1, y1 = min(self.x, other.x), min(self.y, other.y)
         x2, y2 = max(self.x2, other.x2), max(self.y2, other.y2)
 
-        return Rectangle(x1, y1, max(0, x2 - x1), max(0, y2 - y1))
+        # The result is already normalized, so skip __new__'s validation
+        return Rectangle._make((x1, y1, max(0, x2 - x1), max(0, y2 - y1)))
 
     def from_relative(self, other_rect: 'Rectangle') -> 'Rectangle':
         """Interpret self as relative to ``other_rect`` and make it absolute.
@@ -700,8 +750,9 @@ class Rectangle(_Rectangle):
             x and y coordinates should be interpreted as relative to.
         :returns: An absolute-coordinates version of this rectangle.
         """
-        return self._replace(x=self.x + other_rect.x,
-                             y=self.y + other_rect.y)
+        x, y, width, height = self  # pylint: disable=invalid-name
+        return Rectangle._make((x + other_rect.x, y + other_rect.y,
+                           width, height))
 
     def to_relative(self, other_rect: 'Rectangle') -> 'Rectangle':
         """Interpret self as absolute and make it relative to ``other_rect``.
@@ -715,8 +766,9 @@ class Rectangle(_Rectangle):
             x and y coordinates relative to.
         :returns: A relative-coordinates version of this rectangle.
         """
-        return self._replace(x=self.x - other_rect.x,
-                             y=self.y - other_rect.y)
+        x, y, width, height = self  # pylint: disable=invalid-name
+        return Rectangle._make((x - other_rect.x, y - other_rect.y,
+                           width, height))
 
     def to_point(self) -> 'Rectangle':
         """Return a copy of this :class:`Rectangle` with zero width and height.
@@ -736,10 +788,10 @@ class Rectangle(_Rectangle):
         .. todo:: Think about how to refactor :class:`Rectangle` to guard
             against gravity conversion mistakes.
         """
-        return self._replace(
-            x=int(self.x - (self.width * gravity.value[0])),
-            y=int(self.y - (self.height * gravity.value[1]))
-        )
+        grav_x, grav_y = gravity.value
+        x, y, width, height = self
+        return Rectangle._make((int(x - (width * grav_x)),
+                           int(y - (height * grav_y)), width, height))
 
     def to_gravity(self, gravity):  # (Gravity) -> Rectangle
         """Reverse the effect of :meth:`from_gravity`
@@ -754,10 +806,10 @@ class Rectangle(_Rectangle):
         .. note:: This is intended for working in pixel values and will
             round any results to the nearest integer.
         """
-        return self._replace(
-            x=int(self.x + (self.width * gravity.value[0])),
-            y=int(self.y + (self.height * gravity.value[1]))
-        )
+        grav_x, grav_y = gravity.value
+        x, y, width, height = self
+        return Rectangle._make((int(x + (width * grav_x)),
+                           int(y + (height * grav_y)), width, height))
 
     @classmethod
     def from_gdk(cls, gdk_rect):
@@ -799,15 +851,14 @@ class UsableRegion(object):
         self._monitors: List[Rectangle] = []
         self._struts: List[StrutPartial] = []
         self._strut_rects: List[Rectangle] = []
+        self._strut_rects_by_monitor: Dict[Rectangle, List[Rectangle]] = {}
 
-    # TODO: Subscribe to monitor hotplugging in the code which calls this
     def set_monitors(self, monitor_rects: Iterable[Rectangle]):
         """Set the list of monitor rectangles from which to calculate usable
         regions"""
         self._monitors_raw = list(monitor_rects)
         self._update()
 
-    # TODO: Subscribe to changes to panel geometry in the code which calls this
     def set_panels(self, panel_struts: Iterable[StrutPartial]):
         """Set the list of desktop struts to excluded from the usable regions
         """
@@ -840,18 +891,37 @@ class UsableRegion(object):
         # Exclude monitors with zero area
         self._monitors = [x for x in self._monitors_raw if x]
 
+        # Skip the strut arithmetic entirely in the common no-panels case
+        if not self._struts:
+            self._strut_rects = []
+            self._strut_rects_by_monitor = {}
+            return
+
         # Calculate the desktop rectangle (and ensure it extends to (0, 0))
-        desktop_rect = reduce(lambda x, y: x.union(y), self._monitors,
+        desktop_rect = reduce(Rectangle.union, self._monitors,
             Rectangle(0, 0, 0, 0))
 
         # Resolve the struts to Rectangles relative to desktop_rect
-        strut_rects: List[Rectangle] = []
-        for strut in self._struts:
-            # TODO: Test for off-by-one bugs
-            # TODO: Think of a more efficient way to do this
-            for strut_pair in strut.as_rects(desktop_rect):
-                strut_rects.append(self._trim_strut(strut_pair))
-        self._strut_rects = strut_rects
+        # TODO: Test for off-by-one bugs
+        trim_strut = self._trim_strut
+        strut_rects: List[Rectangle] = [trim_strut(strut_pair)
+            for strut in self._struts
+            for strut_pair in strut.as_rects(desktop_rect)]
+
+        # Drop empty reservations once here rather than re-testing them every
+        # time a window is clipped or moved.
+        # (Duplicate and covered ones must be kept for moved_off_of, since
+        # moving off of one panel can move a window back onto another)
+        self._strut_rects = [x for x in strut_rects if x]
+
+        # ...and sort out which ones can affect each monitor so clipping a
+        # window doesn't have to consider panels on the other monitors
+        # (Clipping only ever shrinks the window, so re-clipping against a
+        # panel can't change anything and duplicates can be dropped here)
+        unique_rects = list(dict.fromkeys(self._strut_rects))
+        self._strut_rects_by_monitor = {
+            monitor: [x for x in unique_rects if monitor.overlaps(x)]
+            for monitor in self._monitors}
 
     def _trim_strut(self, strut: Tuple[Edge, Rectangle]) -> Rectangle:
         """Trim a strut rectangle to just the monitor it applies to
@@ -934,7 +1004,10 @@ class UsableRegion(object):
             return None
 
         rect = rect.intersect(monitor)
-        for panel in self._strut_rects:
+        for panel in self._strut_rects_by_monitor.get(monitor, ()):
+            if not rect:
+                # Nothing left to clip, so don't generate candidates for it
+                return None
             rect = rect.subtract(panel)
 
         return rect or None
@@ -12,23 +12,82 @@ import logging
 from contextlib import contextmanager
 
 from Xlib.display import Display as XDisplay
-from Xlib.error import BadWindow, DisplayConnectionError
-from Xlib import Xatom
+from Xlib.error import BadWindow, CatchError, DisplayConnectionError
+from Xlib.protocol.request import GetProperty, InternAtom
+from Xlib import X, Xatom
 
 import gi
 gi.require_version('Gtk', '3.0')
 gi.require_version('Gdk', '3.0')
+gi.require_version('GdkX11', '3.0')
 gi.require_version('Wnck', '3.0')
 
-from gi.repository import Gdk, GdkX11, Wnck
+from gi.repository import Gdk, GdkX11, GLib, Wnck
 
 from .util import (clamp_idx, Rectangle, UsableRegion, StrutPartial,
                    XInitError)
 
 # -- Type-Annotation Imports --
-from typing import Any, Iterable, Optional, Tuple, Union
+from typing import (Any, Callable, Dict, Iterable, List, Optional, Sequence,
+                    Set, Tuple, Union)
+from Xlib.protocol.event import PropertyNotify as XPropertyNotify
+from Xlib.xobject.drawable import Window as XWindow
 # ---
 
+#: The :any:`Wnck.WindowMoveResizeMask` flags controlling each
+#: :class:`quicktile.util.Rectangle` field, in field order.
+#: (As plain :any:`int` values so testing them doesn't allocate GFlags objects)
+_MASK_FLAGS = tuple(int(flag) for flag in (
+    Wnck.WindowMoveResizeMask.X,
+    Wnck.WindowMoveResizeMask.Y,
+    Wnck.WindowMoveResizeMask.WIDTH,
+    Wnck.WindowMoveResizeMask.HEIGHT,
+))
+
+#: A :any:`Wnck.WindowMoveResizeMask` with every flag in :data:`_MASK_FLAGS`
+_FULL_GEOM_MASK = (Wnck.WindowMoveResizeMask.X |
+                   Wnck.WindowMoveResizeMask.Y |
+                   Wnck.WindowMoveResizeMask.WIDTH |
+                   Wnck.WindowMoveResizeMask.HEIGHT)
+
+#: The gravity passed to :any:`Wnck.Window.set_geometry`
+_GRAVITY_STATIC = Wnck.WindowGravity.STATIC
+
+#: The subset of :data:`_FULL_GEOM_MASK` which controls window position
+_POSITION_MASK = Wnck.WindowMoveResizeMask.X | Wnck.WindowMoveResizeMask.Y
+
+#: Properties a window may declare panel reservations with, in order of
+#: preference
+_STRUT_PROPS = ('_NET_WM_STRUT_PARTIAL', '_NET_WM_STRUT')
+
+_MAX_H = Wnck.WindowState.MAXIMIZED_HORIZONTALLY
+_MAX_V = Wnck.WindowState.MAXIMIZED_VERTICALLY
+
+#: The :any:`Wnck.WindowState` bits which :func:`persist_maximization` cares
+#: about (as a plain :any:`int` so masking doesn't allocate a GFlags object)
+_MAXIMIZED_MASK = int(_MAX_H | _MAX_V)
+
+#: The ``(unmaximize, maximize)`` :any:`Wnck.Window` methods to use for each
+#: combination of the bits in :data:`_MAXIMIZED_MASK`
+_MAX_OPS = {
+    int(_MAX_H | _MAX_V): (Wnck.Window.unmaximize, Wnck.Window.maximize),
+    int(_MAX_H): (Wnck.Window.unmaximize_horizontally,
+                  Wnck.Window.maximize_horizontally),
+    int(_MAX_V): (Wnck.Window.unmaximize_vertically,
+                  Wnck.Window.maximize_vertically),
+}
+
+#: Atoms to intern in a single batch when :class:`WindowManager` starts
+_PRELOADED_ATOMS = ('_NET_CLIENT_LIST', '_GTK_WORKAREAS_D0') + _STRUT_PROPS
+
+#: Window types which QuickTile commands should never operate on
+_IRRELEVANT_TYPES = frozenset((Wnck.WindowType.DESKTOP, Wnck.WindowType.DOCK))
+
+#: Upper bound (in 32-bit units) on the size of property values retrieved by
+#: :meth:`WindowManager._request_property`. The X server only sends as much
+#: data as the property actually contains, so this just needs to be generous.
+_MAX_PROPERTY_LENGTH = 2 ** 16
+
 
 @contextmanager
 def persist_maximization(win: Wnck.Window, keep_maximize: bool = True):
@@ -36,22 +95,20 @@ def persist_maximization(win: Wnck.Window, keep_maximize: bool = True):
     :any:`WindowManager.reposition`.
 
     :param win: The window to operate on.
-    :param keep_maximize: If :any:`False`, this decoration becomes a no-op to
-        ease writing clean code which needs to support both behaviours.
+    :param keep_maximize: If :any:`False`, the window is still unmaximized
+        (window managers ignore attempts to move or resize maximized windows)
+        but maximization is not restored afterward.
     """
     # Unmaximize and record the types we may need to restore
-    max_types, maxed = ['', '_horizontally', '_vertically'], []
-    for maxtype in max_types:
-        if getattr(win, 'is_maximized' + maxtype)():
-            maxed.append(maxtype)
-            getattr(win, 'unmaximize' + maxtype)()
+    max_ops = _MAX_OPS.get(int(win.get_state()) & _MAXIMIZED_MASK)
+    if max_ops:
+        max_ops[0](win)
 
     yield
 
     # Restore maximization if asked
-    if maxed and keep_maximize:
-        for maxtype in maxed:
-            getattr(win, 'maximize' + maxtype)()
+    if keep_maximize and max_ops:
+        max_ops[1](win)
 
 
 class WindowManager:
@@ -62,6 +119,9 @@ class WindowManager:
         be used.
     :param x_display: The ``Xlib.display.Display`` to operate on. If
         :any:`None`, a new X connection will be created.
+    :param reposition_delay: How long (in milliseconds)
+        :meth:`reposition` waits for a newer request for the same window to
+        supersede the current one. ``0`` (the default) disables this.
     :raises XInitError: :any:`None` was specified for ``x_display`` and the
         attempt to open a new X connection failed.
 
@@ -73,7 +133,8 @@ class WindowManager:
        in KDE 3.x. Not sure what would be equivalent elsewhere.)
     """
 
-    def __init__(self, screen: Gdk.Screen = None, x_display: XDisplay = None):
+    def __init__(self, screen: Gdk.Screen = None, x_display: XDisplay = None,
+                 reposition_delay: int = 0):
         self.gdk_screen = screen or Gdk.Screen.get_default()
         if self.gdk_screen is None:
             raise XInitError("GTK+ could not open a connection to the X server"
@@ -93,11 +154,352 @@ class WindowManager:
         self.x_root = self.x_screen.root
 
         self.screen = Wnck.Screen.get(self.gdk_screen.get_number())
+        self._xwindows: Dict[int, XWindow] = {self.x_root.id: self.x_root}
+        self._gdk_windows: Dict[int, Gdk.Window] = {}
+        # Cache for _get_atom(), pre-filled to avoid one round-trip per atom
+        self._atoms: Dict[str, int] = {}
+        self._intern_atoms(_PRELOADED_ATOMS)
+        # Cache of get_monitor() results, purged as windows move or close
+        self._monitor_ids: Dict[int, int] = {}
+
+        # Repositioning requests waiting to be applied by _flush_repositions()
+        self.reposition_delay = reposition_delay
+        self._pending_moves: Dict[Wnck.Window, Tuple[Any, ...]] = {}
+        self._pending_timer: Optional[int] = None
+        # The geometry most recently passed to set_geometry() for each window
+        self._requested_geoms: Dict[Wnck.Window, Rectangle] = {}
+
+        # Cache of is_relevant() results, purged as windows close or change
+        # type
+        self._relevance: Dict[Wnck.Window, bool] = {}
+        # Cache of get_relevant_windows() results, cleared on any change
+        self._relevant_windows: Dict[Optional[Wnck.Workspace],
+                                     Tuple[Wnck.Window, ...]] = {}
+        self.screen.connect('window-opened', self._cb_window_opened)
+        self.screen.connect('window-closed', self._cb_window_closed)
+        self.screen.connect('workspace-destroyed', self._cb_windows_changed)
+
+        # Cached workspace count for get_workspace()
+        self._n_workspaces: Optional[int] = None
+        self.screen.connect('workspace-created', self._cb_workspaces_changed)
+        self.screen.connect('workspace-destroyed', self._cb_workspaces_changed)
+        for window in self.screen.get_windows():
+            window.connect('workspace-changed', self._cb_windows_changed)
+            window.connect('geometry-changed', self._cb_window_moved)
+            window.connect('type-changed', self._cb_window_type_changed)
+        self._xevent_handlers: Dict[int, List[Callable[[Any], None]]] = {}
+
+        # State used by watch_geometry() to update the cache incrementally
+        self._watching_geometry = False
+        self._geometry_stale = False
+        self._uses_gtk_workareas = False
+        self._client_wids: Set[int] = set()
+        self._struts_by_wid: Dict[int, StrutPartial] = {}
+        self._stale_struts: Set[int] = set()
+
+        # Cache for get_monitor_geometries()
+        self._monitor_geoms: Optional[Tuple[Rectangle, ...]] = None
+        self.gdk_screen.connect('monitors-changed', self._cb_screen_changed)
+        self.gdk_screen.connect('size-changed', self._cb_screen_changed)
 
         self.usable_region = UsableRegion()
         self.update_geometry_cache()
-        # TODO: Hook monitor-added and monitor-removed and regenerate this
-        # TODO: Hook changes to strut reservations and regenerate this
+
+    def add_xevent_handler(self, event_type: int,
+                           callback: Callable[[Any], None]):
+        """Register a callback to be called for each X event of the given
+        type which arrives on :attr:`x_display`.
+
+        The :func:`GLib.io_add_watch` which dispatches events is installed
+        when the first handler is registered.
+
+        :param event_type: A constant such as :any:`Xlib.X.KeyPress`.
+        :param callback: A function to be called with the event object.
+        """
+        if not self._xevent_handlers:
+            # Merge python-xlib into the GLib event loop
+            # Source: http://www.pygtk.org/pygtk2tutorial/sec-MonitoringIO.html
+            GLib.io_add_watch(self.x_display.display, GLib.PRIORITY_DEFAULT,
+                              GLib.IO_IN, self.cb_xevent)
+        self._xevent_handlers.setdefault(event_type, []).append(callback)
+
+    def cb_xevent(self, src: GLib.IOChannel, cond: GLib.IOCondition,
+            handle: Optional[XDisplay] = None) -> bool:
+        """:func:`GLib.io_add_watch` callback to dispatch X events to the
+        handlers registered with :meth:`add_xevent_handler`.
+
+        :param src: Not used. Just needed to satisfy ``GIOFunc`` signature.
+        :param cond: Not used. Just to needed to satisfy ``GIOFunc`` signature.
+        :param handle: A handle to the Xlib display object with pending events.
+            A cached reference will be used if it is :any:`None`.
+        :rtype: :any:`True`
+        :returns: Always returns :any:`True` to prevent GLib from unsetting
+            the watch.
+
+        .. todo:: Switch to using :data:`python:typing.Literal` in the return
+            signature once it's no longer necessary to support Python
+            versions prior to 3.8.
+        """
+        self._dispatch_xevents(handle or self.x_display)
+
+        # Necessary for proper function
+        return True
+
+    def _dispatch_xevents(self, handle: XDisplay):
+        """Pass every event python-xlib has queued to its handlers.
+
+        Anything which waits for replies from outside :meth:`cb_xevent` must
+        call this afterward. Waiting for a reply drains the socket, so events
+        that arrived in the meantime will sit in python-xlib's queue without
+        waking :func:`GLib.io_add_watch` until unrelated X traffic arrives.
+        """
+        # Handlers make requests of their own, so keep going until python-xlib
+        # has nothing queued rather than relying on the fd to wake us again
+        while handle.pending_events():
+            xevent = handle.next_event()
+            for callback in self._xevent_handlers.get(xevent.type, ()):
+                # An exception escaping the io_add_watch callback would remove
+                # the watch and silently disable every hotkey
+                try:
+                    callback(xevent)
+                except Exception:  # pylint: disable=broad-except
+                    logging.exception("Uncaught exception in X event handler")
+
+    def watch_geometry(self):
+        """Keep the geometry cache up to date by responding to changes in
+        monitor layout and panel reservations as they happen.
+
+        Once this has been called, a change to a single panel's strut
+        reservation only requires that panel to be re-queried, rather than
+        every window in ``_NET_CLIENT_LIST``.
+
+        Events are delivered via the GLib main loop, so this is only useful
+        for long-running instances of QuickTile.
+        """
+        if self._watching_geometry:
+            return
+        self._watching_geometry = True
+
+        self._strut_atoms = frozenset(self._get_atom(name)
+            for name in _STRUT_PROPS)
+        self._client_list_atom = self._get_atom('_NET_CLIENT_LIST')
+        self._workareas_atom = self._get_atom('_GTK_WORKAREAS_D0')
+
+        self.add_xevent_handler(X.PropertyNotify, self._cb_property_notify)
+        self.gdk_screen.connect('monitors-changed', self._cb_monitors_changed)
+
+        # The keybinder shares our X connection, so don't clobber its mask
+        self.x_root.change_attributes(event_mask=X.PropertyChangeMask |
+            self.x_root.get_attributes().your_event_mask)
+
+        # Re-scan so the client windows get watched too
+        self.update_geometry_cache()
+
+    def _cb_window_opened(self, screen: Wnck.Screen, window: Wnck.Window):
+        """Callback for :any:`Wnck.Screen`'s ``window-opened`` signal"""
+        window.connect('workspace-changed', self._cb_windows_changed)
+        window.connect('geometry-changed', self._cb_window_moved)
+        window.connect('type-changed', self._cb_window_type_changed)
+
+        # Update the cached window lists in place rather than rebuilding them
+        if self.is_relevant(window):
+            cache = self._relevant_windows
+            for workspace, windows in cache.items():
+                if workspace is None or window.is_on_workspace(workspace):
+                    cache[workspace] = windows + (window,)
+
+    def _cb_window_closed(self, screen: Wnck.Screen, window: Wnck.Window):
+        """Callback for :any:`Wnck.Screen`'s ``window-closed`` signal"""
+        self._relevance.pop(window, None)
+        self._pending_moves.pop(window, None)
+        self._requested_geoms.pop(window, None)
+
+        cache = self._relevant_windows
+        for workspace, windows in cache.items():
+            if window in windows:
+                cache[workspace] = tuple(x for x in windows if x != window)
+
+        xid = window.get_xid()
+        self._xwindows.pop(xid, None)
+        self._gdk_windows.pop(xid, None)
+        self._monitor_ids.pop(xid, None)
+
+    def _cb_window_moved(self, window: Wnck.Window):
+        """Callback for :any:`Wnck.Window`'s ``geometry-changed`` signal"""
+        self._monitor_ids.pop(window.get_xid(), None)
+
+    def _cb_window_type_changed(self, window: Wnck.Window):
+        """Callback for :any:`Wnck.Window`'s ``type-changed`` signal"""
+        # Relevance is derived from the window type (eg. a splash screen
+        # which becomes a normal window), so re-check it on next use
+        self._relevance.pop(window, None)
+        self._relevant_windows.clear()
+
+    def _cb_windows_changed(self, *args: Any):
+        """Callback for signals which may change which windows are on which
+        workspaces"""
+        self._relevant_windows.clear()
+
+    def _cb_workspaces_changed(self, screen: Wnck.Screen,
+                               workspace: Wnck.Workspace):
+        """Callback for :any:`Wnck.Screen`'s ``workspace-created`` and
+        ``workspace-destroyed`` signals"""
+        self._n_workspaces = None
+
+    def _cb_screen_changed(self, screen: Gdk.Screen):
+        """Callback for :any:`Gdk.Screen`'s ``monitors-changed`` and
+        ``size-changed`` signals"""
+        self._monitor_geoms = None
+        self._monitor_ids.clear()
+
+    def _cb_monitors_changed(self, screen: Gdk.Screen):
+        """Callback for :any:`Gdk.Screen`'s ``monitors-changed`` signal"""
+        # Don't rely on _cb_screen_changed having been called first
+        self._monitor_geoms = None
+        self._monitor_ids.clear()
+
+        if self._uses_gtk_workareas:
+            self.update_geometry_cache()
+        elif self._update_monitors():
+            logging.debug("Usable desktop region calculated as: %s",
+                self.usable_region)
+
+        # Don't strand any keypresses that arrived while waiting for replies
+        self._dispatch_xevents(self.x_display)
+
+    def _cb_property_notify(self, xevent: XPropertyNotify):
+        """Update the geometry cache in response to a change in one of the
+        X11 properties it is derived from."""
+        if xevent.atom == self._workareas_atom:
+            self.update_geometry_cache()
+        elif self._uses_gtk_workareas:
+            return
+        elif xevent.atom == self._client_list_atom:
+            self._update_client_list()
+        elif xevent.atom in self._strut_atoms:
+            # Panels often set several strut properties at once, so gather
+            # up the windows and re-query them all in a single round-trip
+            if not self._stale_struts:
+                GLib.idle_add(self._refresh_struts)
+            self._stale_struts.add(xevent.window.id)
+
+    def _update_client_list(self):
+        """Start or stop tracking struts for windows which have been added to
+        or removed from ``_NET_CLIENT_LIST``."""
+        wids = set(self.get_property(self.x_root,
+            '_NET_CLIENT_LIST', Xatom.WINDOW, empty=()))
+        wids.add(self.x_root.id)
+
+        changed = False
+        for wid in self._client_wids - wids:
+            self._xwindows.pop(wid, None)
+            self._stale_struts.discard(wid)
+            changed |= self._struts_by_wid.pop(wid, None) is not None
+
+        # Send all the queries before reading any replies so that several
+        # windows mapping at once (eg. session restore) cost one round-trip
+        requests = []
+        for wid in wids - self._client_wids:
+            self._watch_window(wid)
+            requests.append((wid, self._request_struts(wid)))
+        for wid, reqs in requests:
+            try:
+                strut = self._read_strut(reqs)
+            except BadWindow:
+                continue
+            if strut:
+                self._struts_by_wid[wid] = strut
+                changed = True
+        self._client_wids = wids
+
+        if changed:
+            self._apply_struts()
+
+    def _refresh_struts(self) -> bool:
+        """:func:`GLib.idle_add` callback to re-query the panel reservations
+        for windows which reported changes to them.
+
+        :returns: :any:`False` so the callback only fires once.
+        """
+        # Skip windows which left _NET_CLIENT_LIST (eg. a panel that changed
+        # its strut and withdrew in the same burst) so their reservations
+        # don't come back as phantom panels
+        client_wids = self._client_wids
+        requests = [(wid, self._request_struts(wid))
+                    for wid in self._stale_struts if wid in client_wids]
+        self._stale_struts.clear()
+
+        changed = False
+        for wid, reqs in requests:
+            try:
+                strut = self._read_strut(reqs)
+            except BadWindow:
+                strut = None
+
+            if strut:
+                changed |= self._struts_by_wid.get(wid) != strut
+                self._struts_by_wid[wid] = strut
+            else:
+                changed |= self._struts_by_wid.pop(wid, None) is not None
+
+        if changed:
+            self._apply_struts()
+
+        # Don't strand any keypresses that arrived while waiting for replies
+        self._dispatch_xevents(self.x_display)
+        return False
+
+    def _read_strut(self, reqs: Tuple[Tuple[str, GetProperty], ...]
+                    ) -> Optional[StrutPartial]:
+        """Wait for the replies to a set of requests from
+        :meth:`_request_struts` and return the preferred strut, if any.
+
+        :raises Xlib.error.BadWindow: The window no longer exists.
+        """
+        for _, req in reqs:
+            result = self._property_reply(req)
+            if result:
+                return StrutPartial.from_property(result)
+        return None
+
+    def _request_struts(self, win: Union[XWindow, int]
+                        ) -> Tuple[Tuple[str, GetProperty], ...]:
+        """Request every property in :data:`_STRUT_PROPS` for a window
+        without waiting for the replies, so a missing
+        ``_NET_WM_STRUT_PARTIAL`` doesn't cost a second round-trip to check
+        for ``_NET_WM_STRUT``.
+
+        :returns: ``(name, request)`` pairs in order of preference.
+        """
+        return tuple((name, self._request_property(win, name, Xatom.CARDINAL))
+                     for name in _STRUT_PROPS)
+
+    def _watch_window(self, wid: int):
+        """Ask for ``PropertyNotify`` events on a client window if
+        :meth:`watch_geometry` is active"""
+        if self._watching_geometry and wid != self.x_root.id:
+            # Windows may close at any time, so don't report BadWindow
+            self._get_xwindow(wid).change_attributes(
+                event_mask=X.PropertyChangeMask, onerror=CatchError(BadWindow))
+
+    def _apply_struts(self):
+        """Push the current set of panel reservations into the geometry
+        cache"""
+        self.usable_region.set_panels(self._struts_by_wid.values())
+        logging.debug("Usable desktop region calculated as: %s",
+            self.usable_region)
+
+    def ensure_geometry_cache(self):
+        """Update the geometry cache if it may be out of date.
+
+        Once :meth:`watch_geometry` has been called, the cache is kept current
+        and this does nothing. Otherwise, there's no way to know when it
+        changed, so it is refreshed on every call after the first one
+        following an update.
+        """
+        if self._geometry_stale:
+            self.update_geometry_cache()
+        self._geometry_stale = not self._watching_geometry
 
     def update_geometry_cache(self):
         """Update the internal cache of monitor & panel shapes by querying
@@ -113,19 +515,25 @@ class WindowManager:
 
         # TODO: Decide how to support having different struts on different
         # desktops like with GNOME Shell under X11
-        result = self.get_property(self.x_root.id,
+        self._geometry_stale = False
+        result = self.get_property(self.x_root,
             '_GTK_WORKAREAS_D0', Xatom.CARDINAL)
+        self._uses_gtk_workareas = bool(result)
         if result:
             logging.debug("Found GNOME Shell workarea information...")
-            monitors = []
-            for monitor in [result[x:x + 4] for x in range(0, len(result), 4)]:
-                if len(monitor) == 4:
-                    monitors.append(Rectangle(x=monitor[0], y=monitor[1],
-                        width=monitor[2], height=monitor[3]))
-                else:
-                    logging.error("_GTK_WORKAREAS_D0 length was not a "
-                        "multiple of 4. Trailing data found: %r", monitor)
-            self.usable_region.set_monitors(monitors)
+            trailing = len(result) % 4
+            if trailing:
+                logging.error("_GTK_WORKAREAS_D0 length was not a "
+                    "multiple of 4. Trailing data found: %r",
+                    result[-trailing:])
+
+            # Read (x, y, width, height) groups straight out of the reply
+            # array rather than slicing it into a sub-array per monitor
+            # (zip() drops any trailing partial group)
+            fields = iter(result)
+            self.usable_region.set_monitors(
+                [Rectangle(*monitor)
+                 for monitor in zip(fields, fields, fields, fields)])
             self.usable_region.set_panels([])
             logging.debug("Usable desktop region calculated as: %s",
                 self.usable_region)
@@ -141,21 +549,19 @@ class WindowManager:
         .. todo:: Use a more specific exception when
            :meth:`update_geometry_cache` fails to retrieve monitor geometries.
         """
+        if self._update_monitors():
+            self._struts_by_wid = self._gather_struts()
+            self._apply_struts()
 
-        # Work around xinerama_get_screen_count not getting registered in
-        # python-xlib if the XINERAMA extension isn't loaded in the host
-        # X session by using Gdk's API instead, which just returns 1.
-        #
-        # NOTE: Not using Gdk.Display.get_n_monitors because Kubuntu 16.04 LTS
-        # doesn't have a new enough Gdk to have that API.
-        n_screens = self.gdk_screen.get_n_monitors()
-        monitors = []
-        for idx in range(0, n_screens):
-            monitors.append(Rectangle.from_gdk(
-                self.gdk_screen.get_monitor_geometry(idx)) *
-                self.gdk_screen.get_monitor_scale_factor(idx))
-            # TODO: Look into using python-xlib to match x_root use
+    def _update_monitors(self) -> bool:
+        """Query monitor geometry to update the geometry cache.
 
+        :returns: :any:`False` if no monitors were found and the cached
+            geometry was kept.
+        :raises Exception: Unable to retrieve monitor geometries and there is
+            no cached value to fall back to.
+        """
+        monitors = self.get_monitor_geometries()
         logging.debug("Loaded monitor geometry: %r", monitors)
 
         # Try to fail gracefully if monitors weren't found
@@ -165,37 +571,59 @@ class WindowManager:
             if self.usable_region:
                 logging.error("WorkArea.update_geometry_cache received "
                               "an empty monitor region! Using cached value.")
-                return
+                return False
 
             raise Exception("Could not retrieve desktop geometry")
+        return True
 
-        # Get the list of struts from the root window
-        self.usable_region.set_panels(self._gather_struts())
-        logging.debug("Usable desktop region calculated as: %s",
-            self.usable_region)
-        return
-
-    def _gather_struts(self):
-        """Gather all toplevel _NET_WM_STRUT/_NET_WM_STRUT_PARTIAL values"""
-        struts = []
-        for wid in [self.x_root.id] + list(self.get_property(
-                self.x_root.id, '_NET_CLIENT_LIST', Xatom.WINDOW, [])):
-            win = self.x_display.create_resource_object('window', wid)
+    def _gather_struts(self) -> Dict[int, StrutPartial]:
+        """Gather all toplevel _NET_WM_STRUT/_NET_WM_STRUT_PARTIAL values
+
+        The ``GetProperty`` requests are pipelined so that this costs a fixed
+        number of round-trips to the X server rather than one per window.
+
+        As a side-effect, this also records the set of windows examined so
+        that :meth:`watch_geometry` can tell which ones are new later.
+
+        :returns: A dict mapping window IDs to their reservations.
+        """
+        # Ask for the client list and the root window's own reservations at
+        # the same time so the latter doesn't wait on the former
+        client_list = self._request_property(
+            self.x_root, '_NET_CLIENT_LIST', Xatom.WINDOW)
+        root_reqs = self._request_struts(self.x_root)
+
+        # ...then fan out requests for every client before reading any replies
+        # (Not just DOCK windows. EWMH doesn't restrict struts to them, some
+        # desktop widgets reserve space too, and filtering by type would cost
+        # an extra round-trip to save a few pipelined requests.)
+        #
+        # This must stay a list rather than a generator or each reply would
+        # be waited on before the next request was sent.
+        wids = self._property_reply(client_list, ())
+        requests = [(self.x_root.id, root_reqs)]
+        for wid in wids:
+            self._watch_window(wid)
+            requests.append((wid, self._request_struts(wid)))
+
+        # Don't let cached python-xlib objects for closed windows pile up
+        # when nothing is listening for window-closed (eg. no main loop)
+        client_wids = {self.x_root.id, *wids}
+        for wid in self._client_wids - client_wids:
+            self._xwindows.pop(wid, None)
+        self._client_wids = client_wids
+
+        struts = {}
+        debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+        for wid, reqs in requests:
             try:
-                result = self.get_property(
-                    win, '_NET_WM_STRUT_PARTIAL', Xatom.CARDINAL)
-                if result:
-                    struts.append(StrutPartial(*result))
-                    logging.debug("Gathered _NET_WM_STRUT_PARTIAL value: %s",
-                                struts)
-                else:
-                    # TODO: Unit test this fallback
-                    result = self.get_property(
-                        win, '_NET_WM_STRUT', Xatom.CARDINAL)
-                    if result:
-                        struts.append(StrutPartial(*result))
-                        logging.debug("Gathered _NET_WM_STRUT value: %s",
-                                      struts)
+                # TODO: Unit test the _NET_WM_STRUT fallback
+                strut = self._read_strut(reqs)
+                if strut:
+                    struts[wid] = strut
+                    if debug:
+                        logging.debug("Gathered strut for %#x: %s",
+                                      wid, strut)
             except BadWindow:
                 logging.warning("Received BadWindow when trying to query a "
                     "window for its panel reservations. This is probably "
@@ -205,34 +633,66 @@ class WindowManager:
 
         return struts
 
+    def get_monitor_geometries(self) -> Sequence[Rectangle]:
+        """Retrieve the geometry of every monitor, indexed by monitor ID and
+        adjusted for HiDPI scaling.
+
+        The result is cached until GDK reports that the monitor layout or
+        screen size has changed.
+        """
+        if self._monitor_geoms is not None:
+            return self._monitor_geoms
+
+        # Work around xinerama_get_screen_count not getting registered in
+        # python-xlib if the XINERAMA extension isn't loaded in the host
+        # X session by using Gdk's API instead, which just returns 1.
+        #
+        # NOTE: Not using Gdk.Display.get_n_monitors because Kubuntu 16.04 LTS
+        # doesn't have a new enough Gdk to have that API.
+        # TODO: Look into using python-xlib to match x_root use
+        screen = self.gdk_screen
+        self._monitor_geoms = tuple(
+            Rectangle.from_gdk(screen.get_monitor_geometry(idx)) *
+            screen.get_monitor_scale_factor(idx)
+            for idx in range(screen.get_n_monitors()))
+        return self._monitor_geoms
+
     def get_monitor(self, win: Wnck.Window) -> Tuple[int, Rectangle]:
         """Given a window, retrieve the ID and geometry of the monitor it's on.
 
         :param win: The window to find the containing monitor for.
         :returns: ``(monitor_id, geometry)``
 
+        The monitor ID is cached until the window is moved or the monitor
+        layout changes.
+
         .. todo:: Look for a way to get the monitor ID without having to
            instantiate a :class:`Gdk.Window`.
 
            Doing so would also remove the need to set ``self.gdk_display`` as
            this is the only user of it.
         """
-        if not isinstance(win, Gdk.Window):
-            win = GdkX11.X11Window.foreign_new_for_display(self.gdk_display,
-                                                           win.get_xid())
-
         # TODO: How do I retrieve the root window from a given one?
         # (Gdk.Display.get_default_screen().get_root_window()... now why did
         # I want to know?)
-        monitor_id = self.gdk_screen.get_monitor_at_window(win)
-        monitor_geom = Rectangle.from_gdk(
-            self.gdk_screen.get_monitor_geometry(monitor_id))
-
-        # TODO: Unit test this
-        monitor_geom *= self.gdk_screen.get_monitor_scale_factor(monitor_id)
+        if isinstance(win, Gdk.Window):
+            monitor_id = self.gdk_screen.get_monitor_at_window(win)
+        else:
+            xid = win.get_xid()
+            monitor_id = self._monitor_ids.get(xid)
+            if monitor_id is None:
+                gdk_win = self._gdk_windows.get(xid)
+                if gdk_win is None:
+                    gdk_win = self._gdk_windows[xid] = (
+                        GdkX11.X11Window.foreign_new_for_display(
+                            self.gdk_display, xid))
+                monitor_id = self._monitor_ids[xid] = (
+                    self.gdk_screen.get_monitor_at_window(gdk_win))
+
+        monitor_geom = self.get_monitor_geometries()[monitor_id]
 
         logging.debug(" Window is on monitor %s, which has geometry %s",
-                      monitor_id, Rectangle.from_gdk(monitor_geom))
+                      monitor_id, monitor_geom)
         return monitor_id, monitor_geom
 
     def get_relevant_windows(self, workspace: Wnck.Workspace
@@ -241,17 +701,32 @@ class WindowManager:
         of type :any:`Wnck.WindowType.DESKTOP` or :any:`Wnck.WindowType.DOCK`.
 
         :param workspace: The virtual desktop to retrieve windows from.
+
+        The result is cached, updated in place as windows open and close, and
+        discarded when a window moves between workspaces.
         """
+        windows = self._relevant_windows.get(workspace)
+        if windows is None:
+            windows = self._relevant_windows[workspace] = tuple(
+                self._filter_relevant_windows(workspace))
+        return windows
+
+    def _filter_relevant_windows(self, workspace: Optional[Wnck.Workspace]
+                                 ) -> Iterable[Wnck.Window]:
+        """Uncached implementation of :meth:`get_relevant_windows`"""
+        is_relevant = self.is_relevant
         for window in self.screen.get_windows():
+            # Don't cycle elements of the desktop
+            # (Checked first because it's usually answered from a cache)
+            if not is_relevant(window):
+                continue
+
             # Skip windows on other virtual desktops for intuitiveness
+            # (Not compared by workspace number so pinned windows still match)
             if workspace and not window.is_on_workspace(workspace):
                 logging.debug("Skipping window on other workspace: %r", window)
                 continue
 
-            # Don't cycle elements of the desktop
-            if not self.is_relevant(window):
-                continue
-
             yield window
 
     def get_workspace(self,
@@ -283,22 +758,44 @@ class WindowManager:
         if not cur:
             return None  # It's either pinned or on no workspaces
 
-        if isinstance(direction, Wnck.MotionDirection):
-            nxt = cur.get_neighbor(direction)
-        elif isinstance(direction, int):
-            # TODO: Deduplicate with the wrapping code in commands.py
-            n_spaces = self.screen.get_workspace_count()
-
-            nxt = self.screen.get_workspace(
-                clamp_idx(cur.get_number() + direction, n_spaces, wrap_around))
-
-        elif direction is None:
-            nxt = cur
-        else:
-            nxt = None
+        # Dispatch on the exact type since Wnck.MotionDirection is an int
+        # subclass and would otherwise have to be tested for first
+        lookup = self._WORKSPACE_LOOKUPS.get(type(direction))
+        if lookup is None:
             logging.warning("Unrecognized direction: %r", direction)
-
-        return nxt
+            return None
+        return lookup(self, cur, direction, wrap_around)
+
+    def _neighbor_workspace(self, cur: Wnck.Workspace,
+            direction: Wnck.MotionDirection, wrap_around: bool
+                            ) -> Optional[Wnck.Workspace]:
+        """:meth:`get_workspace` for a :any:`Wnck.MotionDirection`"""
+        # pylint: disable=no-self-use,unused-argument
+        return cur.get_neighbor(direction)
+
+    def _relative_workspace(self, cur: Wnck.Workspace,
+            direction: int, wrap_around: bool) -> Optional[Wnck.Workspace]:
+        """:meth:`get_workspace` for an :any:`int` offset"""
+        # TODO: Deduplicate with the wrapping code in commands.py
+        n_spaces = self._n_workspaces
+        if n_spaces is None:
+            n_spaces = self._n_workspaces = self.screen.get_workspace_count()
+
+        return self.screen.get_workspace(
+            clamp_idx(cur.get_number() + direction, n_spaces, wrap_around))
+
+    def _same_workspace(self, cur: Wnck.Workspace,
+            direction: None, wrap_around: bool) -> Optional[Wnck.Workspace]:
+        """:meth:`get_workspace` for a ``direction`` of :any:`None`"""
+        # pylint: disable=no-self-use,unused-argument
+        return cur
+
+    #: Implementations of :meth:`get_workspace`, keyed by ``direction`` type
+    _WORKSPACE_LOOKUPS: Dict[type, Callable[..., Optional[Wnck.Workspace]]] = {
+        Wnck.MotionDirection: _neighbor_workspace,
+        int: _relative_workspace,
+        type(None): _same_workspace,
+    }
 
     def _property_prep(self,
             win: Union[Gdk.Window, Wnck.Window, int],
@@ -309,15 +806,80 @@ class WindowManager:
         :param name: An atom name or a handle returned by
             :meth:`Xlib.display.Display.create_resource_object`.
         """
-        if isinstance(win, (Gdk.Window, Wnck.Window)):
-            win = win.get_xid()
-
+        # Test for raw IDs first since that's what the strut-gathering code
+        # passes and it avoids the slower isinstance() checks on GI classes
         if isinstance(win, int):
-            win = self.x_display.create_resource_object('window', win)
+            win = self._get_xwindow(win)
+        elif isinstance(win, (Gdk.Window, Wnck.Window)):
+            win = self._get_xwindow(win.get_xid())
         if isinstance(name, str):
-            name = self.x_display.get_atom(name)
+            name = self._get_atom(name)
         return win, name
 
+    def _get_atom(self, name: str) -> int:
+        """Return the atom for ``name``, interning it on first use.
+
+        Atoms never change for the life of the X connection, so this skips
+        the layers of python-xlib method calls after the first lookup.
+        """
+        atom = self._atoms.get(name)
+        if atom is None:
+            atom = self._atoms[name] = self.x_display.get_atom(name)
+        return atom
+
+    def _intern_atoms(self, names: Iterable[str]):
+        """Intern several atoms using one round-trip to the X server and
+        add them to the cache used by :meth:`_get_atom`."""
+        requests = [(name, InternAtom(display=self.x_display.display,
+                                      defer=True, name=name,
+                                      only_if_exists=False))
+                    for name in names if name not in self._atoms]
+        for name, req in requests:
+            req.reply()
+            self._atoms[name] = req.atom
+
+    def _get_xwindow(self, wid: int) -> XWindow:
+        """Return a cached python-xlib window object for the given ID"""
+        win = self._xwindows.get(wid)
+        if win is None:
+            win = self._xwindows[wid] = self.x_display.create_resource_object(
+                'window', wid)
+        return win
+
+    def _request_property(self,
+            win: Union[Gdk.Window, Wnck.Window, int],
+            name: Union[str, int],
+            prop_type: int) -> GetProperty:
+        """Send a ``GetProperty`` request without waiting for the reply.
+
+        This allows requests for several properties to be pipelined so that
+        retrieving all of them costs one round-trip to the X server rather
+        than one each. Pass the result to :meth:`_property_reply` to retrieve
+        the value.
+
+        :param win: A GTK or Wnck Window object or a raw X11 window ID.
+        :param name: An atom name or a handle returned by
+            :meth:`Xlib.display.Display.create_resource_object`.
+        :param prop_type: A constant from :mod:`Xlib.Xatom`
+        """
+        win, name = self._property_prep(win, name)
+        return GetProperty(display=self.x_display.display, defer=True,
+            delete=False, window=win, property=name, type=prop_type,
+            long_offset=0, long_length=_MAX_PROPERTY_LENGTH)
+
+    @staticmethod
+    def _property_reply(req: GetProperty, empty: Any = None):
+        """Wait for the reply to a request sent by :meth:`_request_property`
+        and return the value of the property.
+
+        :param req: The request object to wait on.
+        :param empty: The value to return if the property is unset.
+        :raises Xlib.error.XError: The X server reported an error in response
+            to the request. (eg. ``BadWindow``)
+        """
+        req.reply()
+        return req.value[1] if req.property_type else empty
+
     # pylint: disable=line-too-long
     def get_property(self,
             win: Union[Gdk.Window, Wnck.Window, int],
@@ -349,11 +911,10 @@ class WindowManager:
             ``AnyPropertyType`` for ``prop_type`` and, if so, factor it out.
 
         """  # NOQA
-        win, name = self._property_prep(win, name)
-
-        result = win.get_full_property(name, prop_type)
-        return result.value if result else empty
-        # TODO: Verify that python-xlib will call XFree for us when appropriate
+        # Unlike get_full_property, this never needs a second round-trip to
+        # fetch the remainder of values longer than python-xlib's size hint
+        return self._property_reply(
+            self._request_property(win, name, prop_type), empty)
 
     def set_property(self,  # pylint: disable=too-many-arguments
             win: Union[Gdk.Window, Wnck.Window, int],
@@ -400,19 +961,25 @@ class WindowManager:
         # TODO: Set an `onerror` handler and at least log an error to console
 
     # XXX: Move `if not window` into a decorator and use it everywhere?
-    @staticmethod
-    def is_relevant(window: Wnck.Window) -> bool:
+    def is_relevant(self, window: Wnck.Window) -> bool:
         """Return :any:`False` if the window should be ignored.
 
         (i.e. If it's the desktop or a panel)
+
+        The result is cached until the window closes or Wnck reports that
+        its type has changed.
         """
-        if not window:
+        # Callers pass either a Wnck.Window or None, so identity is enough
+        if window is None:
             logging.debug("Received no window object to manipulate")
             return False
 
-        if window.get_window_type() in [
-                Wnck.WindowType.DESKTOP,
-                Wnck.WindowType.DOCK]:
+        relevant = self._relevance.get(window)
+        if relevant is None:
+            relevant = self._relevance[window] = (
+                window.get_window_type() not in _IRRELEVANT_TYPES)
+
+        if not relevant:
             logging.debug("Irrelevant window: %r", window)
             return False
 
@@ -426,11 +993,7 @@ class WindowManager:
             geom: Optional[Rectangle] = None,
             monitor: Rectangle = Rectangle(0, 0, 0, 0),
             keep_maximize: bool = False,
-            geometry_mask: Wnck.WindowMoveResizeMask = (
-                Wnck.WindowMoveResizeMask.X |
-                Wnck.WindowMoveResizeMask.Y |
-                Wnck.WindowMoveResizeMask.WIDTH |
-                Wnck.WindowMoveResizeMask.HEIGHT)
+            geometry_mask: Wnck.WindowMoveResizeMask = _FULL_GEOM_MASK
                    ) -> None:
         """
         Move and resize a window, decorations inclusive, according to the
@@ -458,20 +1021,81 @@ class WindowManager:
         .. todo:: Decide how to refactor :meth:`reposition` to allow for
             smarter handling of position clamping when cycling windows through
             a sequence of differently sized monitors.
-        """
-
-        old_geom = Rectangle(*win.get_geometry()).to_relative(
-            self.get_monitor(win)[1])
 
-        new_args = {}
-        if geom:
-            for attr in ('x', 'y', 'width', 'height'):
-                if geometry_mask & getattr(Wnck.WindowMoveResizeMask,
-                        attr.upper()):
-                    new_args[attr] = getattr(geom, attr)
+        If ``reposition_delay`` was set and this is called from within the
+        GLib main loop, the request is held for that many milliseconds so that
+        a burst of requests for the same window only moves it once.
+        """
+        args = (geom, monitor, keep_maximize, geometry_mask)
+
+        if not (self.reposition_delay and GLib.main_depth()):
+            # Debouncing is off or there's no main loop to fire the timer
+            # (eg. command-line use)
+            self._reposition(win, *args)
+            return
+
+        pending = self._pending_moves.get(win)
+        if pending and not (geom and
+                (pending[3] & geometry_mask) == pending[3]):
+            # The new request depends on or doesn't overwrite the old one
+            self._reposition(win, *self._pending_moves.pop(win))
+
+        self._pending_moves[win] = args
+        if self._pending_timer is None:
+            self._pending_timer = GLib.timeout_add(
+                self.reposition_delay, self._flush_repositions)
+
+    def _flush_repositions(self) -> bool:
+        """:func:`GLib.timeout_add` callback to apply the requests queued
+        by :meth:`reposition`
+
+        :returns: :any:`False` so the timer only fires once.
+        """
+        self._pending_timer = None
+        pending, self._pending_moves = self._pending_moves, {}
+        for win, args in pending.items():
+            # Don't let one failure (eg. a window destroyed mid-batch) throw
+            # away the other windows' moves
+            try:
+                self._reposition(win, *args)
+            except Exception:  # pylint: disable=broad-except
+                logging.exception("Failed to reposition %r", win)
+        return False
 
-        # Apply changes and return to absolute desktop coordinates.
-        new_geom = old_geom._replace(**new_args).from_relative(monitor)
+    def _reposition(self,  # pylint: disable=too-many-arguments
+            win: Wnck.Window,
+            geom: Optional[Rectangle],
+            monitor: Rectangle,
+            keep_maximize: bool,
+            geometry_mask: Wnck.WindowMoveResizeMask) -> None:
+        """Unbuffered implementation of :meth:`reposition`"""
+        if geom and (geometry_mask & _FULL_GEOM_MASK) == _FULL_GEOM_MASK:
+            # Every field of the old geometry would be overwritten, so skip
+            # the X round-trips needed to retrieve it
+            cur_geom = None
+            new_geom = geom.from_relative(monitor)
+        else:
+            cur_geom = old_geom = Rectangle._make(win.get_geometry())
+            if not (geom and
+                    (geometry_mask & _POSITION_MASK) == _POSITION_MASK):
+                # Only the position depends on which monitor the window is
+                # relative to, so skip the monitor lookup if it'll be replaced
+                old_geom = old_geom.to_relative(self.get_monitor(win)[1])
+
+            if geom:
+                # Spelled out rather than zip()ped to skip the generator
+                mask = int(geometry_mask)
+                flag_x, flag_y, flag_w, flag_h = _MASK_FLAGS
+                new_x, new_y, new_w, new_h = geom
+                old_x, old_y, old_w, old_h = old_geom
+                old_geom = Rectangle._make((
+                    new_x if mask & flag_x else old_x,
+                    new_y if mask & flag_y else old_y,
+                    new_w if mask & flag_w else old_w,
+                    new_h if mask & flag_h else old_h))
+
+            # Apply changes and return to absolute desktop coordinates.
+            new_geom = old_geom.from_relative(monitor)
 
         # Ensure the window is fully within the monitor
         # TODO: Make this remember the original position and re-derive from it
@@ -482,12 +1106,32 @@ class WindowManager:
         else:
             clipped_geom = new_geom
 
-        if bool(clipped_geom):
+        if clipped_geom:
+            # Wnck's cached geometry lags behind any set_geometry() the WM
+            # hasn't finished applying, so only trust it if our last request
+            # for this window was for the same geometry. (Otherwise, A->B->A
+            # in quick succession would skip the move back to A.)
+            last_geom = self._requested_geoms.get(win, clipped_geom)
+            if last_geom == clipped_geom and clipped_geom == (
+                    cur_geom or Rectangle._make(win.get_geometry())):
+                # Skip the round-trip and WM reflow when nothing would change.
+                # (Unmaximizing and re-maximizing would just cause flicker,
+                # but a partly maximized window still needs to be released)
+                max_state = int(win.get_state()) & _MAXIMIZED_MASK
+                if not max_state or (keep_maximize and
+                                     max_state == _MAXIMIZED_MASK):
+                    logging.debug(" Window is already at %s", clipped_geom)
+                    return
+
             logging.debug(" Repositioning to %s)\n", clipped_geom)
             with persist_maximization(win, keep_maximize):
                 # Always use STATIC because either WMs implement window gravity
                 # incorrectly or it's not applicable to this problem
-                win.set_geometry(Wnck.WindowGravity.STATIC,
-                                 geometry_mask, *clipped_geom)
+                win.set_geometry(_GRAVITY_STATIC, geometry_mask, *clipped_geom)
+            self._requested_geoms[win] = clipped_geom
+
+            # Don't wait for geometry-changed, which may arrive after the
+            # next command or never arrive at all without a main loop
+            self._monitor_ids.pop(win.get_xid(), None)
         else:
             logging.debug(" Geometry clipping failed: %r", clipped_geom)
@@ -11,16 +11,23 @@ __author__ = "Stephan Sokolow (deitarion/SSokolow)"
 __license__ = "GNU GPL 2.0 or later"
 __docformat__ = "restructuredtext en"
 
-import io, os, re
+import importlib.util, io, os, re
 from setuptools import setup
 
-try:
-    import gi
-except ImportError:
-    print("WARNING: Could not import PyGI. You will need to it via your "
-          "package manager (eg. `sudo apt-get install python3-gi`) before you "
-          "will be able to run QuickTile.")
-else:
+
+def check_pygi():
+    """Warn if the PyGI bindings QuickTile needs aren't installed
+
+    (Only called when run as a script, so merely importing this file for
+    :func:`find_version` doesn't load PyGI.)
+    """
+    if importlib.util.find_spec('gi') is None:
+        print("WARNING: Could not import PyGI. You will need to it via your "
+              "package manager (eg. `sudo apt-get install python3-gi`) before "
+              "you will be able to run QuickTile.")
+        return
+
+    import gi  # pylint: disable=import-outside-toplevel
     for name in ['Gdk', 'GdkX11', 'Wnck']:
         try:
             gi.require_version(name, '3.0')
@@ -28,12 +35,13 @@ else:
             print("WARNING: Could not load the PyGI bindings for %s. You will "
                   "need to install them before you will be able to run "
                   "QuickTile." % name)
-    del name
+
 
 # TODO: Switch to PyGI-based D-Bus support
 
 # Get the version from the program rather than duplicating it here
 # Source: https://packaging.python.org/en/latest/single_source_version.html
+_VERSION_RE = re.compile(r"^__version__\s*=\s*['\"]([^'\"]*)['\"]", re.M)
 
 
 def read(*names, **kwargs):
@@ -45,15 +53,14 @@ def read(*names, **kwargs):
 
 def find_version(*file_paths):
     """Extract the value of ``__version__`` from the given file"""
-    version_file = read(*file_paths)
-    version_match = re.search(r"^__version__\s*=\s*['\"]([^'\"]*)['\"]",
-                              version_file, re.M)
+    version_match = _VERSION_RE.search(read(*file_paths))
     if version_match:
         return version_match.group(1)
     raise RuntimeError("Unable to find version string.")
 
 
 if __name__ == '__main__':
+    check_pygi()
     setup(
         name='QuickTile',
         version=find_version("quicktile", "version.py"),
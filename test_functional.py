@@ -101,20 +101,45 @@ minimize
 
 import logging, shlex, subprocess  # nosec
 
-from functional_harness.env_general import background_proc
-from functional_harness.x_server import x_server
-
 log = logging.getLogger(__name__)
 
+#: :data:`TEST_SCRIPT` with comments and blank lines stripped, parsed once
+_TEST_COMMANDS = tuple(x for x in (
+    line.split('#', 1)[0].strip() for line in TEST_SCRIPT.splitlines()) if x)
+
 
 def run_tests(env):
-    """Run the old bank of 'commands don't crash' tests"""
-    lines = [x.split('#')[0].strip() for x in TEST_SCRIPT.split('\n')]
-    lines = [x for x in lines if x]
-    for pos, command in enumerate(lines):
-        log.info("Testing command %d of %d: %s", pos + 1, len(lines), command)
-        subprocess.check_call(['./quicktile.sh', '--no-excepthook',
-            command], env=env)  # nosec
+    """Run the old bank of 'commands don't crash' tests
+
+    :raises subprocess.CalledProcessError: One or more commands failed.
+    """
+    # Run them all in one QuickTile process so the interpreter startup and
+    # GTK/Wnck initialization are only paid once rather than per command
+    argv = ['./quicktile.sh', '--no-excepthook', '--report-results',
+            *_TEST_COMMANDS]
+    total, done, failures = len(_TEST_COMMANDS), 0, []
+    with subprocess.Popen(argv, env=env, stdout=subprocess.PIPE,  # nosec
+                          universal_newlines=True) as proc:
+        for line in proc.stdout:
+            status, _, command = line.rstrip('\n').partition(' ')
+            if status not in ('OK', 'FAIL'):
+                log.debug("QuickTile output: %s", line.rstrip('\n'))
+                continue
+
+            done += 1
+            if status == 'OK':
+                log.info("Command %d of %d passed: %s", done, total, command)
+            else:
+                log.error("Command %d of %d failed: %s", done, total, command)
+                failures.append(command)
+
+    if done < total:
+        log.error("QuickTile exited (status %d) without reporting on: %s",
+                  proc.returncode, ', '.join(_TEST_COMMANDS[done:]))
+    if proc.returncode or failures or done < total:
+        if failures:
+            log.error("Failed commands: %s", ', '.join(failures))
+        raise subprocess.CalledProcessError(proc.returncode, argv)
 
 
 def main():
@@ -150,6 +175,11 @@ def main():
         "unit tested.")
     log.warning("TODO: Inject a test window into the nested X session so "
         "non-windowless commands don't bail out in the common code.")
+    # Deferred so --help doesn't pay for loading the harness (and, through
+    # it, tempfile, shutil, and distutils)
+    from functional_harness.env_general import background_proc
+    from functional_harness.x_server import x_server
+
     log.info("Starting test instance of %s", args.x_server)
     with x_server(shlex.split(args.x_server),
             {0: '1024x768x24', 1: '800x600x24'}) as env:
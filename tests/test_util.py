@@ -5,6 +5,7 @@ __author__ = "Stephan Sokolow (deitarion/SSokolow)"
 __license__ = "GNU GPL 2.0 or later"
 
 import unittest
+from array import array
 
 from quicktile.util import (clamp_idx, euclidean_dist, powerset,
     Edge, Gravity, Rectangle, StrutPartial, UsableRegion, XInitError)
@@ -100,6 +101,18 @@ class TestStrutPartial(unittest.TestCase):
             left_start_y=5, left_end_y=6, right_start_y=7, right_end_y=8,
             top_start_x=9, top_end_x=10, bottom_start_x=11, bottom_end_x=12))
 
+    def test_from_property(self):
+        """StrutPartial: from_property"""
+        full = array('I', range(1, 13))
+        self.assertEqual(StrutPartial.from_property(full),
+                         StrutPartial(*full))
+        self.assertIsInstance(StrutPartial.from_property(full), StrutPartial)
+        self.assertEqual(StrutPartial.from_property(array('I', [1, 2, 3, 4])),
+                         StrutPartial(1, 2, 3, 4))
+
+        with self.assertRaises(TypeError):
+            StrutPartial.from_property(range(13))
+
     def test_as_rects(self):
         """StrutPartial: as_rects (basic function)"""
         test_struts = [
@@ -320,6 +333,18 @@ class TestRectangle(unittest.TestCase):  # pylint: disable=R0904
         # Type mismatches don't cause errors
         self.assertNotIn(1, Rectangle(0, 0, 2, 2))
 
+    def test_overlaps(self):
+        """Rectangle: overlaps agrees with intersect"""
+        base = Rectangle(10, 10, 20, 20)
+        for x in range(0, 40, 5):
+            for y in range(0, 40, 5):
+                for size in (0, 5, 10):
+                    other = Rectangle(x, y, size, size)
+                    self.assertEqual(base.overlaps(other),
+                                     bool(base.intersect(other)), other)
+                    self.assertEqual(other.overlaps(base),
+                                     bool(other.intersect(base)), other)
+
     def test_intersect(self):
         """Rectangle: intersection"""
         self.assertEqual(self.rect1.intersect(self.rect2),
@@ -639,6 +664,71 @@ class TestUsableRegion(unittest.TestCase):
             Rectangle(3300, 640, 1, 1)),
             Rectangle(x=3200, y=56, width=1280, height=1024))
 
+    def test_redundant_struts(self):
+        """UsableRegion: empty struts are pruned and duplicates only merged
+        for clipping"""
+        test_region = UsableRegion()
+        test_region.set_monitors([Rectangle(0, 0, 1280, 1024)])
+        test_region.set_panels([
+            StrutPartial(0, 0, 0, 30, 0, 0, 0, 0, 0, 0, 0, 1279),
+            StrutPartial(0, 0, 0, 30, 0, 0, 0, 0, 0, 0, 0, 1279),
+            StrutPartial(0, 0, 0, 20, 0, 0, 0, 0, 0, 0, 200, 600),
+            StrutPartial(0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+        ])
+
+        # pylint: disable=protected-access
+        self.assertEqual(test_region._strut_rects, [
+            Rectangle(0, 994, 1279, 30), Rectangle(0, 994, 1279, 30),
+            Rectangle(200, 1004, 400, 20)])
+        self.assertEqual(test_region._strut_rects_by_monitor, {
+            Rectangle(0, 0, 1280, 1024): [Rectangle(0, 994, 1279, 30),
+                                          Rectangle(200, 1004, 400, 20)]})
+        self.assertEqual(test_region.clip_to_usable_region(
+            Rectangle(0, 0, 1280, 1024)), Rectangle(0, 0, 1280, 994))
+
+    def test_redundant_struts_ordering(self):
+        """UsableRegion: covered and repeated struts still affect results
+
+        (Regression test for pruning which changed the results of
+        :meth:`Rectangle.subtract` and :meth:`Rectangle.moved_off_of` since
+        they depend on the order in which struts are applied)
+        """
+        test_region = UsableRegion()
+        test_region.set_monitors([Rectangle(0, 0, 1920, 1080)])
+        test_region.set_panels([
+            StrutPartial(0, 60, 0, 52, 0, 0, 479, 1361, 0, 0, 991, 1727),
+            StrutPartial(0, 0, 48, 9, 0, 0, 0, 0, 384, 2232, 701, 2127),
+            StrutPartial(0, 28, 0, 0, 0, 0, 498, 626, 0, 0, 0, 0),
+            StrutPartial(0, 13, 35, 0, 0, 0, 19, 729, 533, 912, 0, 0),
+        ])
+        self.assertEqual(test_region.move_to_usable_region(
+            Rectangle(873, 389, 1453, 1079)), Rectangle(407, 35, 1453, 1079))
+        self.assertEqual(test_region.clip_to_usable_region(
+            Rectangle(466, 1028, 692, 894)), Rectangle(466, 1028, 525, 43))
+
+        # Moving off of one panel can move a window back onto a panel that
+        # was already handled, so repeats must be kept for moving
+        left = StrutPartial(47, 0, 0, 0, 0, 1023, 0, 0, 0, 0, 0, 0)
+        test_region.set_monitors([Rectangle(0, 0, 1280, 1024)])
+        test_region.set_panels([left,
+            StrutPartial(0, 0, 28, 0, 0, 0, 0, 0, 1005, 1279, 0, 0), left])
+        self.assertEqual(test_region.move_to_usable_region(
+            Rectangle(17, 8, 980, 752)), Rectangle(47, 8, 980, 752))
+
+    def test_strut_rects_by_monitor(self):
+        """UsableRegion: struts are only applied to monitors they touch"""
+        left = Rectangle(0, 0, 1280, 1024)
+        right = Rectangle(1280, 0, 1280, 1024)
+        test_region = UsableRegion()
+        test_region.set_monitors([left, right])
+        test_region.set_panels([
+            StrutPartial(0, 0, 0, 30, 0, 0, 0, 0, 0, 0, 0, 1279)])
+
+        # pylint: disable=protected-access
+        self.assertEqual(test_region._strut_rects_by_monitor, {
+            left: [Rectangle(0, 994, 1279, 30)], right: []})
+        self.assertEqual(test_region.clip_to_usable_region(right), right)
+
     def test_clip_to_usable_region(self):
         """UsableRegion: clip_to_usable_region"""
         test_region = UsableRegion()